@@ -16,17 +16,70 @@ Utilisation :
 
 
 import argparse
+import codecs
 import concurrent.futures
+import contextlib
+import html
+import logging
+import os
 import re
+import sys
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO, Tuple
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from requests.adapters import HTTPAdapter
+
+
+log = logging.getLogger(__name__)
 
 
 BASE_URL: str = "https://www.assemblee-nationale.fr"
 DEPUTES_URL: str = "https://www2.assemblee-nationale.fr/deputes/liste/regions"
+USER_AGENT: str = "Scraping-Deputes-France (+https://github.com/franckferman/Scraping-Deputes-France)"
+CACHE_NAME: str = "deputes_cache"
+
+# Nombre de threads par défaut : les requêtes passent l'essentiel de leur temps
+# à attendre le réseau, on peut donc en lancer bien plus que de cœurs CPU.
+DEFAULT_THREADS: int = 16
+
+
+# Identifiant d'un député dans l'URL de sa fiche (ex: /deputes/fiche/OMC_PA12345)
+_ID_RE = re.compile(r"/deputes/fiche/OMC_PA(\d+)")
+# Lien email sur la page d'un député
+_MAIL_RE = re.compile(r"^mailto:")
+
+# Extraction rapide (sur les octets bruts) des champs de la page d'un député
+_EMAIL_RE = re.compile(rb'href="mailto:([^"]+)"')
+_GROUP_RE = re.compile(rb'class="h4 _colored link"[^>]*>([^<]+)<')
+# Contenu du premier <div> de circonscription, puis son <span class="_big">
+_CIRC_DIV_RE = re.compile(
+    rb'_mb-small _centered-text"[^>]*>((?:(?!</div>).)*)', re.DOTALL
+)
+_CIRC_SPAN_RE = re.compile(rb'<span class="_big">([^<]+)</span>')
+
+# Sélecteurs CSS (compilés une seule fois) utilisés si les regex ne trouvent rien
+_SEL_MAIL = CSSSelector("a[href^='mailto:']")
+_SEL_GROUP = CSSSelector("a.h4._colored.link")
+_SEL_CIRC_DIV = CSSSelector("div._mb-small._centered-text")
+_SEL_BIG_SPAN = CSSSelector("span._big")
+
+
+# Liens vers les fiches des député·e·s situés entre le <h2> de la région $r et le <h2> suivant
+_REGION_DEPUTES_XPATH = etree.XPath(
+    "//h2[normalize-space()=$r]/following-sibling::*"
+    "[preceding-sibling::h2[1][normalize-space()=$r]]"
+    "//a[starts-with(@href,'/deputes/fiche/')]"
+)
+
+
+# Session HTTP partagée par tous les threads (keep-alive + pool de connexions)
+SESSION: requests.Session = requests.Session()
+SESSION.headers["User-Agent"] = USER_AGENT
 
 
 # Liste des régions (structurées en <h2> sur la page) valides sur le site de l'Assemblée nationale
@@ -47,6 +100,9 @@ VALID_REGIONS: List[str] = [
     "Réunion"
 ]
 
+# Table de correspondance {région en minuscules: région valide}
+_REGION_LUT: Dict[str, str] = {r.lower(): r for r in VALID_REGIONS}
+
 
 def normalize_region(region: str) -> Optional[str]:
     """
@@ -59,19 +115,90 @@ def normalize_region(region: str) -> Optional[str]:
     Returns:
         str | None: Nom normalisé de la région si valide, sinon None.
     """
-    region = region.strip().lower()
-    for valid_region in VALID_REGIONS:
-        if region == valid_region.lower():
-            return valid_region
-    return None
+    return _REGION_LUT.get(region.strip().lower())
+
+
+def parse_threads(value: str) -> int:
+    """
+    Convertit la valeur de l'option `--threads` en nombre de threads.
+
+    `auto` correspond à `min(32, nombre de CPU * 4)`, une valeur adaptée à un
+    scraping limité par le réseau plutôt que par le CPU.
+
+    Args:
+        value (str): Valeur passée en ligne de commande (entier ou `auto`).
+
+    Returns:
+        int: Nombre de threads à utiliser.
+
+    Raises:
+        argparse.ArgumentTypeError: Si la valeur n'est ni un entier ni `auto`.
+    """
+    if value.strip().lower() == "auto":
+        return min(32, (os.cpu_count() or 1) * 4)
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"valeur invalide '{value}' (entier ou 'auto' attendu)"
+        )
+
+
+def configure_session(
+    pool_size: int,
+    use_cache: bool = True,
+    cache_ttl: int = 86400,
+    revalidate: bool = False
+) -> None:
+    """
+    Prépare la session HTTP partagée par tous les threads.
+
+    Un `HTTPAdapter` est monté sur `https://` afin que chaque thread puisse
+    réutiliser une connexion ouverte vers l'Assemblée nationale au lieu de
+    refaire une poignée de main TCP + TLS à chaque requête. Les retries sont
+    gérés par `get_with_retries`, ils sont donc désactivés au niveau de l'adapter.
+
+    Si le cache est actif, les réponses sont conservées dans une base SQLite
+    (`CACHE_NAME`) et rejouées lors des exécutions suivantes, en respectant
+    les en-têtes HTTP de cache envoyés par le serveur. Une réponse expirée qui
+    possède un `ETag` ou un `Last-Modified` est revalidée par une requête
+    conditionnelle (`If-None-Match` / `If-Modified-Since`) : sur un `304`, le
+    corps déjà en cache est réutilisé sans être retéléchargé.
+
+    Args:
+        pool_size (int): Nombre de connexions conservées par hôte (typiquement le nombre de threads).
+        use_cache (bool): Active le cache local des réponses HTTP. Par défaut `True`.
+        cache_ttl (int): Durée de validité des réponses en cache (secondes). Par défaut 24h.
+        revalidate (bool): Revalide chaque réponse en cache auprès du serveur, même
+            non expirée (requête conditionnelle). Par défaut `False`.
+    """
+    global SESSION
+
+    if use_cache:
+        SESSION = requests_cache.CachedSession(
+            CACHE_NAME,
+            backend="sqlite",
+            expire_after=cache_ttl,
+            cache_control=True,
+            always_revalidate=revalidate
+        )
+    else:
+        SESSION = requests.Session()
+    SESSION.headers["User-Agent"] = USER_AGENT
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=0
+    )
+    SESSION.mount("https://", adapter)
 
 
 def get_with_retries(
     url: str,
     max_retries: int,
     delay_between: float,
-    timeout: float,
-    debug: bool
+    timeout: float
 ) -> Optional[requests.Response]:
     """
     Effectue plusieurs tentatives d'une requête GET sur une URL donnée.
@@ -84,115 +211,146 @@ def get_with_retries(
         max_retries (int): Nombre maximal de tentatives.
         delay_between (float): Délai entre les tentatives en secondes.
         timeout (float): Durée maximale d'attente pour la requête.
-        debug (bool): Active le mode debug.
 
     Returns:
         Optional[requests.Response]: Réponse HTTP si succès, sinon None.
     """
     for attempt in range(1, max_retries + 1):
         try:
-            if debug:
-                print(f"[DEBUG] Attempt {attempt}/{max_retries} fetching: {url}")
-            resp = requests.get(url, timeout=timeout)
+            log.debug("Attempt %d/%d fetching: %s", attempt, max_retries, url)
+            resp = SESSION.get(url, timeout=timeout)
             resp.raise_for_status()
             return resp
         except requests.RequestException as exc:
-            print(f"[ERROR] Attempt {attempt} failed for {url}: {exc}")
+            log.error("Attempt %d failed for %s: %s", attempt, url, exc)
             if attempt < max_retries and delay_between > 0:
-                if debug:
-                    print(f"[DEBUG] Sleeping {delay_between}s before retrying...")
+                log.debug("Sleeping %ss before retrying...", delay_between)
                 time.sleep(delay_between)
     return None
 
 
+def response_encoding(resp: requests.Response) -> str:
+    """
+    Détermine l'encodage à utiliser pour analyser une réponse HTTP avec lxml.
+
+    Les octets bruts sont passés à lxml, qui ne voit pas l'en-tête `Content-Type`.
+    Sans encodage explicite, une page dépourvue de `<meta charset>` serait lue en
+    Latin-1 (noms et régions accentués illisibles). On reprend donc le charset
+    annoncé par le serveur, et UTF-8 (celui de l'Assemblée nationale) à défaut.
+
+    Args:
+        resp (requests.Response): Réponse HTTP reçue.
+
+    Returns:
+        str: Nom de l'encodage.
+    """
+    if "charset=" in resp.headers.get("Content-Type", "").lower() and resp.encoding:
+        try:
+            codecs.lookup(resp.encoding)
+            return resp.encoding
+        except LookupError:
+            # Charset inconnu annoncé par le serveur -> UTF-8
+            pass
+    return "utf-8"
+
+
 def get_deputes_from_region(
-    region_name: str,
-    max_retries: int,
-    delay_between: float,
-    timeout: float,
-    debug: bool = False
-) -> Dict[str, str]:
+    tree: lxml.html.HtmlElement,
+    region_name: str
+) -> Dict[str, Optional[str]]:
     """
-    Récupère une liste de député·e·s pour une région donnée.
+    Récupère la liste des député·e·s d'une région depuis la page `DEPUTES_URL`.
 
-    Cette fonction extrait les noms et URLs des député·e·s d'une région spécifique
-    sur la page `DEPUTES_URL`. L'HTML est structuré en sections `<h2>` pour les
-    régions, `<h4 class='departementTitre'>` pour les départements, et des `<li>`
-    contenant les liens vers les fiches des députés.
+    L'HTML est structuré en sections `<h2>` pour les régions, suivies des listes
+    de liens vers les fiches des députés. Une requête XPath (exécutée par lxml)
+    sélectionne directement les liens `/deputes/fiche/` situés entre le `<h2>`
+    de la région et le `<h2>` suivant. L'identifiant `PAxxxxxx` de chaque député
+    est extrait dès cette étape.
 
     Args:
-        region_name (str): Nom de la région à scraper.
-        max_retries (int): Nombre maximal de tentatives pour récupérer la page.
-        delay_between (float): Temps d'attente entre chaque tentative (secondes).
-        timeout (float): Temps limite d'attente pour la requête (secondes).
-        debug (bool, optional): Active le mode debug. Par défaut `False`.
+        tree (lxml.html.HtmlElement): Page `DEPUTES_URL` déjà analysée.
+        region_name (str): Nom de la région (tel qu'écrit dans son `<h2>`).
 
     Returns:
-        Dict[str, str]: Dictionnaire `{Nom député: URL}` des député·e·s trouvés.
+        Dict[str, Optional[str]]: Dictionnaire `{Nom député: ID}` (ID à None si
+            le lien ne contient pas d'identifiant `OMC_PA`).
     """
-    if debug:
-        print(f"[DEBUG] Collecting deputies for region: {region_name}")
+    deputes_map: Dict[str, Optional[str]] = {}
+    for a_tag in _REGION_DEPUTES_XPATH(tree, r=region_name):
+        match_id = _ID_RE.search(a_tag.get("href"))
+        deputes_map[a_tag.text_content().strip()] = (
+            f"PA{match_id.group(1)}" if match_id else None
+        )
+    return deputes_map
 
-    resp = get_with_retries(
-        DEPUTES_URL,
-        max_retries=max_retries,
-        delay_between=delay_between,
-        timeout=timeout,
-        debug=debug
+
+def parse_depute_page(
+    content: bytes,
+    encoding: str = "utf-8"
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Extrait l'email, le groupe et la circonscription de la page d'un député.
+
+    Les trois champs sont d'abord recherchés par expressions régulières directement
+    sur les octets de la réponse, sans construire d'arbre HTML. Si l'un d'eux n'est
+    pas trouvé (balisage différent de celui attendu), la page est analysée avec lxml
+    et interrogée avec des sélecteurs CSS précompilés.
+
+    Args:
+        content (bytes): Corps brut de la réponse HTTP.
+        encoding (str): Encodage de la page (voir `response_encoding`). Par défaut UTF-8.
+
+    Returns:
+        Tuple[Optional[str], Optional[str], Optional[str]]: (email, groupe, circonscription).
+    """
+    # Comme le chemin lxml, seul le premier <div> de circonscription est considéré
+    circ_div = _CIRC_DIV_RE.search(content)
+    matches = (
+        _EMAIL_RE.search(content),
+        _GROUP_RE.search(content),
+        _CIRC_SPAN_RE.search(circ_div.group(1)) if circ_div else None,
     )
-    if not resp:
-        print(f"[ERROR] Could not fetch region page: {DEPUTES_URL}")
-        return {}
-
-    soup = BeautifulSoup(resp.text, "html.parser")
-    region_h2 = None
-
-    # Trouver la balise <h2> correspondant à la région recherchée (region_name)
-    for h2_tag in soup.find_all("h2"):
-        if h2_tag.get_text(strip=True) == region_name:
-            region_h2 = h2_tag
-            break
-
-    if not region_h2:
-        if debug:
-            print(f"[WARNING] No <h2> found for region {region_name}.")
-        return {}
-
-    deputes_map: Dict[str, str] = {}
-
-    # Parcourir les éléments suivants dans l'HTML
-    for sibling in region_h2.next_siblings:
-        if sibling.name == "h2":
-            # Nouvelle région détectée -> arrêt
-            break
-        if sibling.name == "h4" and sibling.get("class") == ["departementTitre"]:
-            # Récupérer les <li> suivants contenant les députés
-            for sub_sib in sibling.next_siblings:
-                if sub_sib.name in ("h4", "h2"):
-                    # Nouvelle région ou département -> arrêt
-                    break
-                if sub_sib.name == "div":
-                    li_tags = sub_sib.find_all("li")
-                    for li_tag in li_tags:
-                        a_tag = li_tag.find("a", href=True)
-                        if a_tag and a_tag["href"].startswith("/deputes/fiche/"):
-                            name = a_tag.get_text(strip=True)
-                            full_url = BASE_URL + a_tag["href"]
-                            deputes_map[name] = full_url
-
-    if debug:
-        print(f"[DEBUG] Deputies found for {region_name}: {list(deputes_map.keys())}")
-    return deputes_map
+    if all(matches):
+        try:
+            email, group, circonscription = (
+                html.unescape(m.group(1).decode(encoding)).strip() for m in matches
+            )
+            return email, group, circonscription
+        except UnicodeDecodeError:
+            # Octets invalides pour l'encodage annoncé -> analyse complète par lxml
+            pass
+
+    try:
+        tree = lxml.html.fromstring(
+            content, parser=lxml.html.HTMLParser(encoding=encoding)
+        )
+    except etree.ParserError:
+        # Corps vide ou illisible -> aucun champ exploitable
+        return None, None, None
+
+    # Extraction de l'email (mailto:)
+    mail_tags = _SEL_MAIL(tree)
+    email = (_MAIL_RE.sub("", mail_tags[0].get("href")) or None) if mail_tags else None
+
+    # Extraction du groupe parlementaire
+    group_tags = _SEL_GROUP(tree)
+    group = group_tags[0].text_content().strip() if group_tags else None
+
+    # Extraction de la circonscription (dans le premier <div> correspondant uniquement)
+    circ_divs = _SEL_CIRC_DIV(tree)
+    big_spans = _SEL_BIG_SPAN(circ_divs[0]) if circ_divs else []
+    circonscription = big_spans[0].text_content().strip() if big_spans else None
+
+    return email, group, circonscription
 
 
 def get_depute_info(
     name: str,
-    url: str,
+    deputy_id: Optional[str],
     region: str,
     max_retries: int,
     delay_between: float,
-    timeout: float,
-    debug: bool = False
+    timeout: float
 ) -> Dict[str, Optional[str]]:
     """
     Récupère les informations détaillées d'un député.
@@ -204,17 +362,16 @@ def get_depute_info(
     - Groupe parlementaire
     - Circonscription
 
-    Elle transforme l'URL `/deputes/fiche/OMC_PAxxxxxx` en `/dyn/deputes/PAxxxxxx`
-    pour accéder à la version dynamique du profil.
+    Elle accède directement à la version dynamique du profil (`/dyn/deputes/PAxxxxxx`)
+    à partir de l'identifiant extrait de la page des régions.
 
     Args:
         name (str): Nom du député.
-        url (str): URL du profil du député sur le site de l'Assemblée nationale.
+        deputy_id (Optional[str]): Identifiant du député (ex: `PA12345`).
         region (str): Région d'élection du député.
         max_retries (int): Nombre maximal de tentatives en cas d'échec.
         delay_between (float): Temps d'attente entre les tentatives (secondes).
         timeout (float): Délai maximal d'attente pour la requête (secondes).
-        debug (bool, optional): Active le mode debug. Par défaut `False`.
 
     Returns:
         Dict[str, Optional[str]]: Dictionnaire contenant :
@@ -224,11 +381,8 @@ def get_depute_info(
             - "groupe" (str ou None)
             - "circonscription" (str ou None)
     """
-    # Extraire l'ID du député (ex: OMC_PA12345)
-    match_id = re.search(r"/deputes/fiche/OMC_PA(\d+)", url)
-    if not match_id:
-        if debug:
-            print(f"[WARNING] Can't extract OMC_PA ID from {url}")
+    if not deputy_id:
+        log.warning("No OMC_PA ID found for %s", name)
         return {
             "nom": name,
             "region": region,
@@ -237,16 +391,14 @@ def get_depute_info(
             "circonscription": None,
         }
 
-    deputy_id = f"PA{match_id.group(1)}"
     dyn_url = f"{BASE_URL}/dyn/deputes/{deputy_id}"
 
     # Récupération de la page dynamique du député
     resp = get_with_retries(
-        dyn_url, max_retries, delay_between, timeout, debug
+        dyn_url, max_retries, delay_between, timeout
     )
     if not resp:
-        if debug:
-            print(f"[ERROR] Could not fetch {dyn_url} after retries.")
+        log.error("Could not fetch %s after retries.", dyn_url)
         return {
             "nom": name,
             "region": region,
@@ -255,28 +407,10 @@ def get_depute_info(
             "circonscription": None,
         }
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-
-    # Extraction de l'email (mailto:)
-    a_mail = soup.find("a", href=re.compile(r"^mailto:"))
-    email = a_mail["href"].replace("mailto:", "") if a_mail else None
-    if debug:
-        print(f"[DEBUG] Email for {name} => {email}")
-
-    # Extraction du groupe parlementaire
-    group_tag = soup.find("a", class_="h4 _colored link")
-    group = group_tag.get_text(strip=True) if group_tag else None
-
-    # Extraction de la circonscription
-    circ_div = soup.find("div", class_="_mb-small._centered-text")
-    # Correction : s'il y a un point dans la classe -> on retente
-    if not circ_div:
-        circ_div = soup.find("div", class_="_mb-small _centered-text")
-    circonscription = None
-    if circ_div:
-        big_span = circ_div.find("span", class_="_big")
-        if big_span:
-            circonscription = big_span.get_text(strip=True)
+    email, group, circonscription = parse_depute_page(
+        resp.content, response_encoding(resp)
+    )
+    log.debug("Email for %s => %s", name, email)
 
     return {
         "nom": name,
@@ -318,32 +452,49 @@ def build_ascii_table(
         row = [dep.get(f, "") or "" for f in fields]
         rows.append(row)
 
-    # Largeur max. pour chaque colonne
-    col_widths: List[int] = []
-    for c in range(len(fields)):
-        col_widths.append(
-            max(len(str(rows[r][c])) for r in range(len(rows)))
-        )
+    # Largeur max. pour chaque colonne (parcours colonne par colonne via zip)
+    col_widths: List[int] = [max(map(len, column)) for column in zip(*rows)]
 
     # Construction du tableau
-    lines: List[str] = []
-    for i, row in enumerate(rows):
-        cells = [str(cell).ljust(col_widths[c]) for c, cell in enumerate(row)]
-        line = " | ".join(cells)
-        lines.append(line)
-        if i == 0:
-            sep = "-+-".join("-" * w for w in col_widths)
-            lines.append(sep)
+    lines: List[str] = [
+        " | ".join(cell.ljust(width) for cell, width in zip(row, col_widths))
+        for row in rows
+    ]
+    lines.insert(1, "-+-".join("-" * w for w in col_widths))
 
     return "\n".join(lines)
 
 
+def write_depute(
+    file_out: TextIO,
+    dep: Dict[str, Optional[str]],
+    fields: List[str],
+    labels: List[str],
+    skip_separators: bool
+) -> None:
+    """
+    Écrit immédiatement les informations d'un député dans le flux de sortie.
+
+    Args:
+        file_out (TextIO): Flux de sortie (fichier ou `sys.stdout`).
+        dep (Dict[str, Optional[str]]): Informations du député.
+        fields (List[str]): Liste des champs à afficher.
+        labels (List[str]): Préfixe de chaque champ (ex: "Email: "), vide si --barefields.
+        skip_separators (bool): N'écrit pas la ligne de tirets après le député.
+    """
+    lines: List[str] = [
+        label + (dep.get(field) or "") for label, field in zip(labels, fields)
+    ]
+    if not skip_separators:
+        lines.append("-" * 40)
+    file_out.write("\n".join(lines) + "\n")
+
+
 def scrape_deputes(
     regions: List[str],
     multithreading: bool = False,
-    max_threads: int = 5,
+    max_threads: int = DEFAULT_THREADS,
     output_file: Optional[str] = None,
-    debug: bool = False,
     retries: int = 3,
     delay: float = 0.0,
     req_timeout: float = 10.0,
@@ -351,6 +502,9 @@ def scrape_deputes(
     use_table: bool = False,
     barefields: bool = False,
     no_separator: bool = False,
+    use_cache: bool = True,
+    cache_ttl: int = 86400,
+    revalidate: bool = False,
 ) -> None:
     """
     Scrape les informations des député·e·s français (Nom, Région, Email, Groupe, Circonscription)
@@ -361,7 +515,6 @@ def scrape_deputes(
         multithreading (bool): Active le mode multithreading pour accélérer le scraping.
         max_threads (int): Nombre maximum de threads utilisés si multithreading est activé.
         output_file (Optional[str]): Nom du fichier où enregistrer les résultats (si fourni).
-        debug (bool): Active le mode debug pour afficher des logs détaillés.
         retries (int): Nombre maximum de tentatives en cas d'échec des requêtes.
         delay (float): Délai en secondes entre les tentatives en cas d'échec.
         req_timeout (float): Timeout (secondes) des requêtes HTTP.
@@ -369,6 +522,9 @@ def scrape_deputes(
         use_table (bool): Génère un tableau ASCII récapitulatif des députés.
         barefields (bool): Affiche uniquement les valeurs sans labels (utile pour export CSV-like).
         no_separator (bool): Supprime la ligne de séparation si --barefields + 1 champ.
+        use_cache (bool): Active le cache local (SQLite) des réponses HTTP.
+        cache_ttl (int): Durée de validité des réponses en cache (secondes).
+        revalidate (bool): Revalide les réponses en cache par requête conditionnelle.
 
     Returns:
         None: Affiche les résultats dans la console ou les enregistre dans un fichier.
@@ -376,87 +532,104 @@ def scrape_deputes(
     if fields is None:
         fields = ["nom", "region", "email", "groupe", "circonscription"]
 
-    # 1) Collecte des URLs des députés par région
-    deputes_data: List[tuple] = []
-    for region in regions:
-        region_map = get_deputes_from_region(
-            region,
-            max_retries=retries,
-            delay_between=delay,
-            timeout=req_timeout,
-            debug=debug
+    configure_session(
+        max_threads if multithreading else 1,
+        use_cache=use_cache,
+        cache_ttl=cache_ttl,
+        revalidate=revalidate
+    )
+
+    # 1) Page des régions (téléchargée une seule fois)
+    resp = get_with_retries(
+        DEPUTES_URL,
+        max_retries=retries,
+        delay_between=delay,
+        timeout=req_timeout
+    )
+    if not resp:
+        log.error("Could not fetch region page: %s", DEPUTES_URL)
+        return
+    try:
+        tree = lxml.html.fromstring(
+            resp.content,
+            parser=lxml.html.HTMLParser(encoding=response_encoding(resp))
         )
-        for dep_name, dep_url in region_map.items():
-            deputes_data.append((dep_name, dep_url, region))
+    except etree.ParserError as exc:
+        log.error("Could not parse region page %s: %s", DEPUTES_URL, exc)
+        return
 
-    if debug:
-        print(f"[DEBUG] Found {len(deputes_data)} deputies total.")
+    # Condition : 1 seul champ, barefields, no_separator -> pas de lignes de tirets
+    skip_separators: bool = (
+        barefields and len(fields) == 1 and no_separator
+    )
+    # Libellés calculés une seule fois pour tous les députés
+    labels: List[str] = [
+        "" if barefields else field.capitalize() + ": " for field in fields
+    ]
 
-    # 2) Récupération des informations détaillées
-    results: List[Dict[str, Optional[str]]] = []
+    # Un seul worker = exécution séquentielle des requêtes
+    workers: int = max_threads if multithreading else 1
     if multithreading:
-        if debug:
-            print(f"[DEBUG] Using multithreading with {max_threads} workers.")
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_threads) as executor:
-            future_map = {
-                executor.submit(
-                    get_depute_info,
-                    dep_name,
-                    dep_url,
-                    dep_region,
-                    retries,
-                    delay,
-                    req_timeout,
-                    debug
-                ): (dep_name, dep_url, dep_region)
-                for (dep_name, dep_url, dep_region) in deputes_data
-            }
-            for future in concurrent.futures.as_completed(future_map):
-                results.append(future.result())
+        log.debug("Using multithreading with %d workers.", workers)
     else:
-        if debug:
-            print("[DEBUG] Running sequentially.")
-        for (dep_name, dep_url, dep_region) in deputes_data:
-            info = get_depute_info(
-                dep_name, dep_url, dep_region,
-                retries, delay, req_timeout, debug
-            )
-            results.append(info)
+        log.debug("Running sequentially.")
 
-    # 3) Mise en forme des résultats
-    lines: List[str] = []
-    # Condition : 1 seul champ, barefields, no_separator -> pas de lignes de tirets
-    skip_separators: bool = (
-        barefields and len(fields) == 1 and no_separator
+    out_ctx = (
+        open(output_file, "w", encoding="utf-8")
+        if output_file else contextlib.nullcontext(sys.stdout)
     )
+    with out_ctx as file_out:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            # 2) Les fiches d'une région sont soumises dès que sa liste est extraite,
+            # sans attendre les régions suivantes ({future: position de soumission})
+            future_map: Dict[concurrent.futures.Future, int] = {}
+            for region in regions:
+                region_map = get_deputes_from_region(tree, region)
+                if not region_map:
+                    log.warning("No deputies found for region %s.", region)
+                elif log.isEnabledFor(logging.DEBUG):
+                    log.debug("Deputies found for %s: %s", region, list(region_map.keys()))
+                for dep_name, dep_id in region_map.items():
+                    future = executor.submit(
+                        get_depute_info,
+                        dep_name,
+                        dep_id,
+                        region,
+                        retries,
+                        delay,
+                        req_timeout
+                    )
+                    future_map[future] = len(future_map)
+
+            log.debug("Found %d deputies total.", len(future_map))
+
+            # 3) Récupération des informations détaillées : les résultats arrivés en
+            # avance sont mis en attente par position de soumission, et chaque député
+            # est écrit dès que tous ceux qui le précèdent l'ont été (sortie déterministe).
+            # Seules les données nécessaires au tableau ASCII sont conservées ensuite.
+            pending: Dict[int, Dict[str, Optional[str]]] = {}
+            results: List[Dict[str, Optional[str]]] = []
+            next_to_write: int = 0
+            for future in concurrent.futures.as_completed(future_map):
+                pending[future_map[future]] = future.result()
+                while next_to_write in pending:
+                    info = pending.pop(next_to_write)
+                    write_depute(file_out, info, fields, labels, skip_separators)
+                    if use_table:
+                        results.append(info)
+                    next_to_write += 1
+                if not output_file:
+                    # stdout est bufferisé par blocs quand il est redirigé (| tee, > fichier)
+                    file_out.flush()
+
+        # 4) Génération du tableau ASCII
+        if use_table:
+            file_out.write("\n=== TABLEAU RÉCAPITULATIF ===\n")
+            file_out.write(build_ascii_table(results, fields))
+            file_out.write("\n")
 
-    for dep in results:
-        for field in fields:
-            val: str = dep.get(field, "") or ""
-            if barefields:
-                lines.append(val)
-            else:
-                lines.append(f"{field.capitalize()}: {val}")
-        if not skip_separators:
-            lines.append("-" * 40)
-
-    # 4) Génération du tableau ASCII
-    ascii_table: str = ""
-    if use_table:
-        ascii_table = "\n\n=== TABLEAU RÉCAPITULATIF ===\n"
-        ascii_table += build_ascii_table(results, fields)
-        ascii_table += "\n"
-
-    final_output: str = "\n".join(lines) + ascii_table
-
-    # 5) Enregistrement ou affichage
     if output_file:
-        with open(output_file, "w", encoding="utf-8") as file_out:
-            file_out.write(final_output)
-        if debug:
-            print(f"[DEBUG] Results saved to {output_file}")
-    else:
-        print(final_output)
+        log.debug("Results saved to %s", output_file)
 
 
 def main() -> None:
@@ -467,7 +640,7 @@ def main() -> None:
     Args:
         --list-regions (bool) : Affiche la liste des régions valides et quitte.
         --region (str) : Liste des régions à scraper (ex: 'Île-de-France' 'Bretagne').
-        --threads (int) : Nombre de threads à utiliser (1 = exécution séquentielle).
+        --threads (int | 'auto') : Nombre de threads à utiliser (1 = exécution séquentielle).
         --output (str) : Nom du fichier de sortie (si spécifié).
         --debug (bool) : Active le mode debug pour plus de logs.
         --retries (int) : Nombre de tentatives en cas d'échec des requêtes.
@@ -477,6 +650,9 @@ def main() -> None:
         --table (bool) : Génère un tableau ASCII des résultats.
         --barefields (bool) : Affiche uniquement les valeurs sans labels.
         --no-separator (bool) : Supprime la ligne de séparation si --barefields + 1 champ.
+        --no-cache (bool) : Désactive le cache local des réponses HTTP.
+        --cache-ttl (int) : Durée de validité du cache en secondes.
+        --revalidate (bool) : Revalide les pages en cache auprès du serveur (ETag / Last-Modified).
 
     Returns:
         None: Exécute le script et affiche les résultats ou les enregistre.
@@ -494,8 +670,8 @@ def main() -> None:
                         help="Régions à scraper (ex: 'Ile-de-France' 'Bretagne'). Par défaut, Ile-de-France et Provence-Alpes-Côte d'Azur.")
 
     # Options de scraping
-    parser.add_argument("--threads", type=int, default=1,
-                        help="Nombre de threads à utiliser (1 = séquentiel).")
+    parser.add_argument("--threads", type=parse_threads, default=DEFAULT_THREADS,
+                        help=f"Nombre de threads à utiliser (1 = séquentiel, 'auto' = min(32, CPU x 4), {DEFAULT_THREADS} par défaut).")
     parser.add_argument("--output", type=str,
                         help="Fichier où sauvegarder les résultats.")
     parser.add_argument("--debug", action="store_true",
@@ -514,9 +690,20 @@ def main() -> None:
                         help="Affiche uniquement les valeurs sans labels (ex: juste l'email).")
     parser.add_argument("--no-separator", action="store_true",
                         help="Si --barefields + 1 champ, supprime la ligne de séparation.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Désactive le cache local des réponses HTTP.")
+    parser.add_argument("--cache-ttl", type=int, default=86400,
+                        help="Durée de validité du cache en secondes (86400 par défaut).")
+    parser.add_argument("--revalidate", action="store_true",
+                        help="Revalide les pages en cache auprès du serveur (requêtes conditionnelles ETag / Last-Modified).")
 
     args = parser.parse_args()
 
+    # Le niveau DEBUG ne concerne que les logs du script (pas urllib3 / requests_cache)
+    logging.basicConfig(level=logging.WARNING, format="[%(levelname)s] %(message)s")
+    if args.debug:
+        log.setLevel(logging.DEBUG)
+
     # Affichage de la liste des régions valides
     if args.list_regions:
         print(f"🌍 Régions valides :\n  - " + "\n  - ".join(VALID_REGIONS))
@@ -531,8 +718,9 @@ def main() -> None:
 
     # Vérification et normalisation des régions
     if args.region:
-        selected_regions = [normalize_region(r) for r in args.region if normalize_region(r)]
-        invalid_regions = [r for r in args.region if not normalize_region(r)]
+        normalized = [(r, normalize_region(r)) for r in args.region]
+        selected_regions = [n for _, n in normalized if n]
+        invalid_regions = [r for r, n in normalized if not n]
 
         if invalid_regions:
             print(f"[ERROR] Régions invalides détectées: {', '.join(invalid_regions)}")
@@ -554,14 +742,16 @@ def main() -> None:
         multithreading=use_threads,
         max_threads=args.threads,
         output_file=args.output,
-        debug=args.debug,
         retries=args.retries,
         delay=args.delay,
         req_timeout=args.timeout,
         fields=selected_fields,
         use_table=args.table,
         barefields=args.barefields,
-        no_separator=args.no_separator
+        no_separator=args.no_separator,
+        use_cache=not args.no_cache,
+        cache_ttl=args.cache_ttl,
+        revalidate=args.revalidate
     )
 
 